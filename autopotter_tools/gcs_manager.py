@@ -7,11 +7,23 @@ Combines inventory management and upload operations in a single interface.
 import os
 import sys
 import json
+import time
 import random
 import argparse
-from datetime import datetime, timezone
-from typing import Dict, List, Any
-from google.cloud import storage
+import base64
+import hashlib
+import functools
+import mimetypes
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    # Only for annotations; the runtime import is deferred to _make_client()
+    from google.cloud import storage
 
 # Import from the package
 try:
@@ -21,12 +33,53 @@ except ImportError:
 
 from config import get_config
 
+# Extension sets used to categorize inventory files
+_VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v'})
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.svg'})
+_MUSIC_EXTS = frozenset({'.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg', '.wma', '.aiff'})
+
+# Subsets offered by the video/audio selection helpers
+_SELECTABLE_VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv'})
+_SELECTABLE_AUDIO_EXTS = frozenset({'.mp3', '.wav', '.m4a', '.aac', '.flac'})
+
+# Partial-response masks for list_blobs; only the properties each caller reads are fetched
+_SCAN_FIELDS = 'items(name,size,md5Hash,timeCreated,updated,metadata),nextPageToken'
+_LATEST_FIELDS = 'items(name,size,timeCreated),nextPageToken'
+
+def _is_folder_marker(blob) -> bool:
+    """Folder markers are zero-byte objects named with a trailing '/'; the int test settles most blobs."""
+    return not blob.size and blob.name.endswith('/')
+
+# Default size (bytes) above which files are uploaded as concurrent multipart chunks,
+# and the chunk threads per file; override with gcs_multipart_threshold /
+# gcs_multipart_chunk_size / gcs_multipart_workers
+_MULTIPART_THRESHOLD = 32 * 1024 * 1024
+_MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+_MULTIPART_WORKERS = 4
+
+@functools.lru_cache(maxsize=8)
+def _make_client(api_key_path: str, pool_size: int) -> "storage.Client":
+    """
+    Build a storage client for a service account key, reused across GCSManager instances.
+    
+    The HTTP pool is sized so upload workers don't queue for (or discard) pooled
+    connections, and connection-level failures are retried with backoff.
+    google.cloud.storage is imported here rather than at module level so the
+    CLI's --help and argument errors don't pay for loading it.
+    """
+    from google.cloud import storage
+    client = storage.Client.from_service_account_json(api_key_path)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=Retry(total=3, backoff_factor=2))
+    client._http.mount("https://", adapter)
+    return client
+
 class GCSManager:
     """
     Unified GCS manager that handles both inventory operations and upload operations.
     """
     
-    def __init__(self, config_path: str = "autopost_config.enhanced.json"):
+    def __init__(self, config_path: str = "autopost_config.enhanced.json", upload_workers: int = None):
         self.config = get_config(config_path)
         self.gcs_config = self.config.get_gcs_config()
         
@@ -36,14 +89,29 @@ class GCSManager:
         if not self.gcs_config.get('bucket'):
             raise ValueError("GCS bucket name not configured")
         
-        # Initialize GCS client
-        self.client = storage.Client.from_service_account_json(self.gcs_config['api_key_path'])
+        # Uploads run in a thread pool sized to the client's connection pool
+        self.upload_workers = upload_workers or self.gcs_config.get('upload_workers', 16)
+        
+        # Size cutoff, chunk size (bytes) and per-file threads for concurrent multipart uploads
+        self.multipart_threshold = self.gcs_config.get('multipart_threshold', _MULTIPART_THRESHOLD)
+        self.multipart_chunk_size = self.gcs_config.get('multipart_chunk_size', _MULTIPART_CHUNK_SIZE)
+        self.multipart_workers = self.gcs_config.get('multipart_workers', _MULTIPART_WORKERS)
+        
+        # Initialize GCS client (shared by managers using the same credentials); every upload
+        # worker may be running a multipart upload, so the pool covers all their chunk threads
+        self.client = _make_client(self.gcs_config['api_key_path'], self.upload_workers * self.multipart_workers)
         self.bucket_name = self.gcs_config['bucket']
         self.bucket = self.client.bucket(self.bucket_name)
+        self._url_prefix = f"https://storage.googleapis.com/{self.bucket_name}/"
         
         # Configure folders to scan
         self.folders_to_scan = self.gcs_config.get('folders', None)
         
+        # Recent scan_folder results keyed by prefix: {prefix: (monotonic timestamp, files)}
+        self.scan_cache_ttl = self.gcs_config.get('scan_cache_ttl', 60)
+        self._scan_cache = {}
+        self._scan_cache_lock = threading.Lock()
+        
         Logger.info(f"GCS Manager initialized for bucket: {self.bucket_name}")
     
     # ==================== INVENTORY OPERATIONS ====================
@@ -58,22 +126,34 @@ class GCSManager:
         Returns:
             List of file metadata dictionaries
         """
+        with self._scan_cache_lock:
+            cached = self._scan_cache.get(folder_prefix)
+        if cached and time.monotonic() - cached[0] < self.scan_cache_ttl:
+            Logger.debug(f"Using cached listing for {folder_prefix}")
+            return list(cached[1])
+        
         Logger.info(f"Scanning folder: {folder_prefix}")
         
         try:
-            blobs = list(self.bucket.list_blobs(prefix=folder_prefix))
+            blobs = self.bucket.list_blobs(prefix=folder_prefix, fields=_SCAN_FIELDS)
             files = []
             
             for blob in blobs:
-                # Skip folder markers (blobs ending with /)
-                if blob.name.endswith('/'):
+                # Skip folder markers (empty blobs ending with /)
+                if _is_folder_marker(blob):
                     continue
                 
                 # Get basic file info
+                # The list response already carries size and timestamps, so callers
+                # never need a per-blob reload()
                 file_info = {
                     'name': blob.name,
-                    'size_mb': round(blob.size / (1024 * 1024), 2) if blob.size else 0,
-                    'public_url': f"https://storage.googleapis.com/{self.bucket_name}/{blob.name}",
+                    'size': blob.size or 0,
+                    # Base64 MD5 as GCS reports it; None for composite/multipart objects
+                    'md5_hash': blob.md5_hash,
+                    'created': blob.time_created,
+                    'updated': blob.updated,
+                    'public_url': self._url_prefix + blob.name,
                     'metadata': {}
                 }
                 
@@ -86,12 +166,28 @@ class GCSManager:
                 files.append(file_info)
             
             Logger.info(f"Found {len(files)} files in {folder_prefix}")
-            return files
+            with self._scan_cache_lock:
+                self._scan_cache[folder_prefix] = (time.monotonic(), files)
+            return list(files)
             
         except Exception as e:
             Logger.error(f"Failed to scan folder {folder_prefix}: {e}")
             return []
     
+    def invalidate(self, blob_name: str = None):
+        """
+        Drop cached folder listings that could contain blob_name (all listings if None).
+        
+        Args:
+            blob_name: Name of a blob that was just created or changed
+        """
+        with self._scan_cache_lock:
+            if blob_name is None:
+                self._scan_cache.clear()
+                return
+            for prefix in [p for p in self._scan_cache if blob_name.startswith(p)]:
+                del self._scan_cache[prefix]
+    
     def _categorize_file(self, filename: str) -> str:
         """
         Categorize a file based on its extension.
@@ -102,21 +198,12 @@ class GCSManager:
         Returns:
             Category string: 'videos', 'images', 'music', or 'other'
         """
-        filename_lower = filename.lower()
-        
-        # Video file extensions
-        video_extensions = ['.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v']
-        if any(filename_lower.endswith(ext) for ext in video_extensions):
+        ext = os.path.splitext(filename)[1].lower()
+        if ext in _VIDEO_EXTS:
             return 'videos'
-        
-        # Image file extensions
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.svg']
-        if any(filename_lower.endswith(ext) for ext in image_extensions):
+        if ext in _IMAGE_EXTS:
             return 'images'
-        
-        # Music/Audio file extensions
-        music_extensions = ['.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg', '.wma', '.aiff']
-        if any(filename_lower.endswith(ext) for ext in music_extensions):
+        if ext in _MUSIC_EXTS:
             return 'music'
         
         # Default to other for text, config, and unknown files
@@ -148,34 +235,34 @@ class GCSManager:
                 }
             }
             
-            # Scan each configured folder
-            for folder in self.folders_to_scan:
-                try:
-                    files = self.scan_folder(folder)
+            total_size = 0
+            
+            # Scan the configured folders concurrently; map() keeps results in folder order
+            with ThreadPoolExecutor(max_workers=max(1, len(self.folders_to_scan))) as executor:
+                scans = list(executor.map(self.scan_folder, self.folders_to_scan))
+            
+            # scan_folder() logs its own failures and returns [], so no per-folder handling is needed
+            for folder, files in zip(self.folders_to_scan, scans):
+                if files:
+                    # Create folder URL
+                    folder_url = f"{self._url_prefix}{folder}/"
                     
-                    if files:
-                        # Create folder URL
-                        folder_url = f"https://storage.googleapis.com/{self.bucket_name}/{folder}/"
-                        
-                        # Extract just the filenames (without folder prefix)
-                        file_names = []
-                        for file_info in files:
-                            # Extract filename from full path (e.g., "video_uploads/file.mp4" -> "file.mp4")
-                            filename = os.path.basename(file_info['name'])
-                            file_names.append(filename)
-                            
-                            # Update summary counts
-                            inventory_data['summary']['total_files'] += 1
-                            inventory_data['summary']['total_size_mb'] += file_info.get('size_mb', 0)
+                    # Extract just the filenames (without folder prefix)
+                    file_names = []
+                    for file_info in files:
+                        # Extract filename from full path (e.g., "video_uploads/file.mp4" -> "file.mp4")
+                        filename = os.path.basename(file_info['name'])
+                        file_names.append(filename)
                         
-                        # Add folder to inventory
-                        inventory_data['files_by_folder'][folder_url] = file_names
+                        # Update summary counts
+                        inventory_data['summary']['total_files'] += 1
+                        total_size += file_info['size']
                     
-                except Exception as e:
-                    Logger.error(f"Error scanning folder {folder}: {e}")
+                    # Add folder to inventory
+                    inventory_data['files_by_folder'][folder_url] = file_names
             
-            # Round total size
-            inventory_data['summary']['total_size_mb'] = round(inventory_data['summary']['total_size_mb'], 2)
+            # Convert the byte total to MB once for the summary
+            inventory_data['summary']['total_size_mb'] = round(total_size / (1024 * 1024), 2)
             
             # Save to file if output path provided
             if output_path:
@@ -203,9 +290,31 @@ class GCSManager:
         Returns:
             True if successful, False otherwise
         """
+        from google.cloud.storage.retry import DEFAULT_RETRY
+        try:
+            # Parallel multipart uploads need a recent google-cloud-storage
+            from google.cloud.storage import transfer_manager
+        except ImportError:
+            transfer_manager = None
+        
         try:
             blob = self.bucket.blob(destination_blob_name)
-            blob.upload_from_filename(source_file_path)
+            if transfer_manager is not None and os.path.getsize(source_file_path) > self.multipart_threshold:
+                # Large files go up as concurrent XML multipart chunks instead of one
+                # sequential resumable stream. The resulting object has no MD5 hash
+                # (only a composite ETag), so don't rely on md5_hash for these.
+                transfer_manager.upload_chunks_concurrently(
+                    source_file_path, blob,
+                    content_type=mimetypes.guess_type(source_file_path)[0],
+                    chunk_size=self.multipart_chunk_size,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=self.multipart_workers,
+                )
+            else:
+                # Plain uploads are only retried by default when a generation precondition
+                # is set; overwriting a blob with the same file is safe to repeat
+                blob.upload_from_filename(source_file_path, retry=DEFAULT_RETRY)
+            self.invalidate(destination_blob_name)
             Logger.info(f"Uploaded {source_file_path} to {self.bucket_name}/{destination_blob_name}")
             return True
         except Exception as e:
@@ -224,13 +333,8 @@ class GCSManager:
             True if successful, False otherwise
         """
         try:
-            for root, _, files in os.walk(source_folder):
-                for file in files:
-                    local_file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(local_file_path, source_folder)
-                    destination_blob_name = os.path.join(destination_folder_prefix, relative_path).replace("\\", "/")
-                    if not self.upload_file(local_file_path, destination_blob_name):
-                        return False
+            if not self._upload_many(self._iter_folder_uploads(source_folder, destination_folder_prefix)):
+                return False
             
             Logger.info(f"Uploaded folder {source_folder} to {self.bucket_name}/{destination_folder_prefix}")
             return True
@@ -238,6 +342,99 @@ class GCSManager:
             Logger.error(f"Failed to upload folder {source_folder}: {e}")
             return False
     
+    def _iter_files(self, source_folder: str) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Recursively yield (path, stat) for regular files under source_folder.
+        
+        Uses os.scandir so each file is stat'ed once through its DirEntry, rather
+        than os.walk plus separate getmtime/getsize calls. Like os.walk, directories
+        that can't be listed (including a missing source_folder) are skipped.
+        """
+        stack = [source_folder]
+        while stack:
+            folder = stack.pop()
+            try:
+                entries = os.scandir(folder)
+            except OSError as e:
+                Logger.warning(f"Skipping unreadable folder {folder}: {e}")
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path, entry.stat()
+    
+    @staticmethod
+    def _local_md5(path: str) -> str:
+        """Base64-encoded MD5 of a local file, in the form GCS reports md5Hash."""
+        digest = hashlib.md5()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return base64.b64encode(digest.digest()).decode('ascii')
+    
+    def _iter_folder_uploads(self, source_folder: str, destination_folder_prefix: str,
+                             newer_than: datetime = None,
+                             existing_blobs: Dict[str, Tuple[int, Optional[str]]] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Walk source_folder lazily, yielding (local path, blob name) pairs to upload.
+        
+        Args:
+            source_folder: Path to the local folder
+            destination_folder_prefix: Destination folder prefix in GCS
+            newer_than: Only yield files modified after this time, if given
+            existing_blobs: Blob name -> (size, md5_hash) of objects already in GCS; files whose
+                size and MD5 both match are skipped. The local file is only hashed when the
+                size already matches, and blobs without an MD5 are always re-uploaded.
+        """
+        # Compare raw POSIX timestamps so no datetime is built per file
+        cutoff = newer_than.timestamp() if newer_than is not None else None
+        for local_file_path, stat in self._iter_files(source_folder):
+            if cutoff is not None and stat.st_mtime <= cutoff:
+                continue
+            relative_path = os.path.relpath(local_file_path, source_folder)
+            destination_blob_name = os.path.join(destination_folder_prefix, relative_path).replace("\\", "/")
+            if existing_blobs and destination_blob_name in existing_blobs:
+                size, md5_hash = existing_blobs[destination_blob_name]
+                if size == stat.st_size and md5_hash and md5_hash == self._local_md5(local_file_path):
+                    continue
+            yield local_file_path, destination_blob_name
+    
+    def _upload_many(self, uploads: Iterable[Tuple[str, str]]) -> bool:
+        """
+        Upload (local path, blob name) pairs concurrently.
+        
+        Pairs are submitted as they are produced, so a lazy folder walk overlaps
+        with the uploads already in flight. At most twice the worker count is
+        outstanding at once, which keeps memory flat for very large trees.
+        Every upload is allowed to finish before reporting, so one failure
+        doesn't leave others half-submitted.
+        
+        Returns:
+            True if every upload succeeded, False otherwise
+        """
+        max_pending = self.upload_workers * 2
+        submitted = 0
+        failed = 0
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            for local_path, blob_name in uploads:
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    failed += sum(1 for future in done if not future.result())
+                pending.add(executor.submit(self.upload_file, local_path, blob_name))
+                submitted += 1
+            
+            for future in as_completed(pending):
+                if not future.result():
+                    failed += 1
+        
+        if failed:
+            Logger.error(f"{failed} of {submitted} uploads failed")
+            return False
+        return True
+    
     def get_most_recent_file_creation_time(self, prefix: str = None) -> datetime:
         """
         Get the most recent file creation time in a folder.
@@ -249,15 +446,19 @@ class GCSManager:
             Most recent creation time or None if no files found
         """
         try:
-            blobs = list(self.bucket.list_blobs(prefix=prefix))
+            # Keep only the running max while paging instead of holding every blob
+            most_recent_blob = None
+            for blob in self.bucket.list_blobs(prefix=prefix, fields=_LATEST_FIELDS):
+                # Skip folder blobs
+                if _is_folder_marker(blob):
+                    continue
+                if most_recent_blob is None or blob.time_created > most_recent_blob.time_created:
+                    most_recent_blob = blob
             
-            # Filter out folder blobs
-            file_blobs = [blob for blob in blobs if not blob.name.endswith('/')]
-            if not file_blobs:
+            if most_recent_blob is None:
                 Logger.info("No files found.")
                 return None
             
-            most_recent_blob = max(file_blobs, key=lambda blob: blob.time_created)
             Logger.info(f"The most recent file is: {most_recent_blob.name}")
             return most_recent_blob.time_created
             
@@ -267,7 +468,8 @@ class GCSManager:
     
     def upload_new_files(self, source_folder: str, destination_folder_prefix: str = "") -> bool:
         """
-        Upload only new files that are newer than the most recent file in GCS.
+        Upload only new files that are newer than the most recent file in GCS
+        and not already present there with the same content.
         
         Args:
             source_folder: Path to the local folder
@@ -279,16 +481,13 @@ class GCSManager:
         try:
             most_recent_creation_time = self.get_most_recent_file_creation_time(destination_folder_prefix)
             
-            for root, _, files in os.walk(source_folder):
-                for file in files:
-                    local_file_path = os.path.join(root, file)
-                    file_time = datetime.fromtimestamp(os.path.getmtime(local_file_path)).astimezone(timezone.utc)
-                    
-                    if most_recent_creation_time is None or file_time > most_recent_creation_time:
-                        relative_path = os.path.relpath(local_file_path, source_folder)
-                        destination_blob_name = os.path.join(destination_folder_prefix, relative_path).replace("\\", "/")
-                        if not self.upload_file(local_file_path, destination_blob_name):
-                            return False
+            # Skip files already in the bucket with the same content (e.g. re-touched copies);
+            # one listing covers every candidate instead of a metadata request per file
+            existing_blobs = {f['name']: (f['size'], f['md5_hash']) for f in self.scan_folder(destination_folder_prefix)}
+            uploads = self._iter_folder_uploads(source_folder, destination_folder_prefix,
+                                                most_recent_creation_time, existing_blobs)
+            if not self._upload_many(uploads):
+                return False
             
             Logger.info(f"Uploaded new files from {source_folder} to {self.bucket_name}/{destination_folder_prefix}")
             return True
@@ -299,10 +498,13 @@ class GCSManager:
     
     # ==================== SELECTION OPERATIONS ====================
     
-    def get_available_videos(self) -> List[Dict[str, Any]]:
+    def get_available_videos(self, sort: bool = True) -> List[Dict[str, Any]]:
         """
         Get list of available video files from video_uploads folder.
         
+        Args:
+            sort: Sort the list by creation time (newest first)
+            
         Returns:
             List of video file dictionaries with metadata
         """
@@ -310,23 +512,17 @@ class GCSManager:
             all_files = self.scan_folder("video_uploads/")
             
             # Filter for video files only
-            video_extensions = ['.mp4', '.mov', '.avi', '.mkv']
             video_files = []
             
             for file_info in all_files:
-                if any(file_info['name'].lower().endswith(ext) for ext in video_extensions):
-                    # Get blob for additional metadata
-                    blob = self.bucket.blob(file_info['name'])
-                    blob.reload()
-                    
+                if os.path.splitext(file_info['name'])[1].lower() in _SELECTABLE_VIDEO_EXTS:
                     # Handle None values for time fields
-                    created_time = blob.time_created if blob.time_created else blob.updated
-                    updated_time = blob.updated if blob.updated else created_time
+                    created_time = file_info['created'] if file_info['created'] else file_info['updated']
+                    updated_time = file_info['updated'] if file_info['updated'] else created_time
                     
                     video_files.append({
                         'name': file_info['name'],
-                        'size': blob.size,
-                        'size_mb': file_info['size_mb'],
+                        'size': file_info['size'],
                         'created': created_time,
                         'updated': updated_time,
                         'public_url': file_info['public_url']
@@ -334,7 +530,8 @@ class GCSManager:
             
             # Sort by creation time (newest first), filtering out None values
             video_files = [v for v in video_files if v['created'] is not None]
-            video_files.sort(key=lambda x: x['created'], reverse=True)
+            if sort:
+                video_files.sort(key=lambda x: x['created'], reverse=True)
             
             return video_files
             
@@ -347,24 +544,24 @@ class GCSManager:
         Select the next video to process based on upload history.
         
         Args:
-            uploaded_videos: List of already uploaded videos
+            uploaded_videos: List of already uploaded videos (dicts with a "video" key)
             
         Returns:
             Selected video dictionary or None if no new videos
         """
         try:
-            available_videos = self.get_available_videos()
+            # Only the newest candidate is needed, so skip sorting the full listing
+            available_videos = self.get_available_videos(sort=False)
             
-            # Filter out already uploaded videos
-            uploaded_video_names = [item["video"] for item in uploaded_videos]
-            new_videos = [v for v in available_videos if v['name'] not in uploaded_video_names]
+            # Filter out already uploaded videos (set for O(1) membership checks)
+            uploaded_video_names = {item["video"] for item in uploaded_videos}
+            new_videos = (v for v in available_videos if v['name'] not in uploaded_video_names)
             
-            if not new_videos:
+            # Select the most recent new video in a single pass
+            selected_video = max(new_videos, key=lambda x: x['created'], default=None)
+            if selected_video is None:
                 return None
             
-            # Select the most recent new video
-            selected_video = new_videos[0]
-            
             # Optional: Check for minimum video quality/size
             if selected_video['size'] < 1024 * 1024:  # Less than 1MB
                 Logger.warning(f"Selected video {selected_video['name']} is very small ({selected_video['size']} bytes)")
@@ -386,20 +583,14 @@ class GCSManager:
             all_files = self.scan_folder("music_uploads/")
             
             # Filter for audio files only
-            audio_extensions = ['.mp3', '.wav', '.m4a', '.aac', '.flac']
             audio_files = []
             
             for file_info in all_files:
-                if any(file_info['name'].lower().endswith(ext) for ext in audio_extensions):
-                    # Get blob for additional metadata
-                    blob = self.bucket.blob(file_info['name'])
-                    blob.reload()
-                    
+                if os.path.splitext(file_info['name'])[1].lower() in _SELECTABLE_AUDIO_EXTS:
                     audio_files.append({
                         'name': file_info['name'],
-                        'size': blob.size,
-                        'size_mb': file_info['size_mb'],
-                        'created': blob.time_created,
+                        'size': file_info['size'],
+                        'created': file_info['created'],
                         'public_url': file_info['public_url']
                     })
             
@@ -451,12 +642,13 @@ def main():
     parser.add_argument("--destination_blob", type=str, help="Destination blob name for upload operations")
     parser.add_argument("--source_folder", type=str, help="Path to source folder for upload operations")
     parser.add_argument("--destination_folder", type=str, help="Destination folder prefix for upload operations")
+    parser.add_argument("--num_workers", type=int, default=None, help="Concurrent uploads (default: gcs_upload_workers from config, or 16)")
     
     args = parser.parse_args()
     
     try:
         # Initialize the manager
-        gcs_manager = GCSManager(args.config)
+        gcs_manager = GCSManager(args.config, upload_workers=args.num_workers)
         
         if args.operation == "inventory":
             print("🔍 Generating GCS inventory organized by file type...")
@@ -518,14 +710,14 @@ def main():
             videos = gcs_manager.get_available_videos()
             print(f"✅ Found {len(videos)} videos")
             for video in videos[:5]:  # Show first 5
-                print(f"  - {video['name']} ({video['size_mb']:.2f} MB)")
+                print(f"  - {video['name']} ({video['size'] / (1024 * 1024):.2f} MB)")
                 
         elif args.operation == "get_audio":
             print("🎵 Getting available audio...")
             audio_files = gcs_manager.get_audio_options()
             print(f"✅ Found {len(audio_files)} audio files")
             for audio in audio_files[:5]:  # Show first 5
-                print(f"  - {audio['name']} ({audio['size_mb']:.2f} MB)")
+                print(f"  - {audio['name']} ({audio['size'] / (1024 * 1024):.2f} MB)")
         
     except Exception as e:
         print(f"❌ Operation failed: {e}")
@@ -2,6 +2,12 @@ import openai
 from typing import Optional, Any
 from autopotter_tools.simplelogger import Logger
 
+try:
+    # httpx comes with the OpenAI SDK but isn't a direct requirement; fall back to SDK defaults without it
+    import httpx
+except ImportError:
+    httpx = None
+
 
 class GPTAPI:
     """
@@ -10,13 +16,25 @@ class GPTAPI:
 
     """
     
-    def __init__(self, model: str, use_previous_response_id: bool = False, previous_response_id: Optional[str] = None):
+    # (api_key, base_url) pairs whose access check already passed in this process
+    _access_verified = set()
+    
+    # One OpenAI client (and its HTTP connection pool) shared by all instances
+    _shared_client = None
+    
+    # Responses calls are seconds apart, so keep idle connections well past httpx's 5s default
+    _HTTP_LIMITS = (httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=120.0)
+                    if httpx is not None else None)
+    
+    def __init__(self, model: str, use_previous_response_id: bool = False, previous_response_id: Optional[str] = None,
+                 lazy_auth: bool = True):
         """
         Initialize the GPT API client.
         
         Args:
             use_previous_response_id: Whether to save previous_response_id from responses
             previous_response_id: Optional previous response ID to pass to API calls
+            lazy_auth: Skip the models.list() preflight; auth errors surface from the first prompt() instead
         """
         self.model = model
         self.use_previous_response_id = use_previous_response_id
@@ -24,16 +42,24 @@ class GPTAPI:
         
         Logger.info("Initializing GPT API client...")
         
-        # Initialize OpenAI client
+        # Initialize OpenAI client, reusing the pooled one from earlier instances
         try:
-            self.client = openai.OpenAI()
-            Logger.info("OpenAI client created")
+            if GPTAPI._shared_client is None:
+                if GPTAPI._HTTP_LIMITS is not None and hasattr(openai, "DefaultHttpxClient"):
+                    GPTAPI._shared_client = openai.OpenAI(
+                        http_client=openai.DefaultHttpxClient(limits=GPTAPI._HTTP_LIMITS)
+                    )
+                else:
+                    GPTAPI._shared_client = openai.OpenAI()
+                Logger.info("OpenAI client created")
+            self.client = GPTAPI._shared_client
         except Exception as e:
             Logger.error(f"Failed to create OpenAI client: {e}")
             raise
         
-        # Check API access
-        self._check_access()
+        # Check API access up front only when asked; prompt() reports the same errors
+        if not lazy_auth:
+            self._check_access()
         
         Logger.info("GPT API initialized successfully")
         if self.use_previous_response_id:
@@ -44,11 +70,17 @@ class GPTAPI:
         Verify that we have valid API access by attempting a simple API call.
         Raises an error if access is not available.
         """
+        access_key = (self.client.api_key, str(self.client.base_url))
+        if access_key in GPTAPI._access_verified:
+            Logger.debug("API access already verified for this key")
+            return
+        
         try:
             Logger.info("Checking API access...")
             # Try to list models as a simple access check
             # This is a lightweight operation that verifies API key validity
             models = self.client.models.list()
+            GPTAPI._access_verified.add(access_key)
             Logger.info("API access verified successfully")
         except openai.AuthenticationError as e:
             Logger.error(f"Authentication failed: {e}")
@@ -154,12 +186,13 @@ class GPTAPI:
                     Logger.error("API response is empty or missing output.")
                     raise RuntimeError("API response is empty or missing output.")
                 
-                # Find the message item (may not be at index 0 if there's a reasoning item)
+                # Find the first message item (may not be at index 0 if there's a reasoning item)
+                ret = None
                 for item in response.output:
                     # check for type='message' attribute
-                    if hasattr(item, "type") and item.type == "message":
-                        if hasattr(item, "content") and item.content is not None and len(item.content) > 0:
-                            ret = item
+                    if getattr(item, "type", None) == "message" and getattr(item, "content", None):
+                        ret = item
+                        break
 
                 if ret is None:
                     Logger.error("API response does not contain a message item with content.")
@@ -187,6 +220,12 @@ class GPTAPI:
             Logger.info("API call completed successfully")
             return response
             
+        except openai.AuthenticationError as e:
+            Logger.error(f"Authentication failed: {e}")
+            raise ValueError(f"OpenAI API authentication failed: {e}")
+        except openai.PermissionDeniedError as e:
+            Logger.error(f"Permission denied: {e}")
+            raise ValueError(f"OpenAI API permission denied: {e}")
         except Exception as e:
             Logger.error(f"Error during API call: {e}")
             raise
@@ -5,14 +5,21 @@ This module expands the existing Instagram API to generate comprehensive account
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import time
 import sys, os
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the parent directory to Python path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add the parent directory to Python path to import config (once per process)
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 try:
     from simplelogger import Logger
@@ -21,6 +28,24 @@ except ImportError:
     
 from config import get_config
 
+# Seconds to wait on a Graph call before giving up (per attempt; the session retries);
+# a batch runs its sub-requests server-side, so it gets longer
+_REQUEST_TIMEOUT = 10
+_BATCH_TIMEOUT = 30
+
+# The Graph API batch endpoint accepts at most 50 requests per call
+_GRAPH_BATCH_LIMIT = 50
+
+# Scopes needed for Instagram publishing, comment management and insights
+_REQUIRED_SCOPES = (
+    'instagram_basic',
+    'instagram_content_publish',
+    'instagram_manage_comments',
+    'instagram_manage_insights',
+    'pages_read_engagement',
+    'pages_manage_metadata'
+)
+
 class InstagramAnalyticsManager:
     """
     Enhanced Instagram API manager that generates comprehensive account analytics.
@@ -31,8 +56,13 @@ class InstagramAnalyticsManager:
      - Control parameters like post limits to grab should be in the config. 
      - account_insights could be more thorougly explored
      - media_insights should be more thorougly explored: https://developers.facebook.com/docs/instagram-platform/reference/instagram-media/insights
+     - test_available_fields / test_insights_configurations are diagnostics for the --fulltest CLI
+       flag only; nothing on the export or workflow path should call them.
     """
     
+    # access token -> (monotonic time checked, permission info), shared by all instances
+    _permissions_cache = {}
+    
     def __init__(self, config_path: str = "autopost_config.enhanced.json"):
         self.config = get_config(config_path)
         # self.instagram_config = self.config.get_instagram_config()
@@ -40,6 +70,14 @@ class InstagramAnalyticsManager:
         self.base_url = "https://graph.facebook.com/v22.0"
         self.access_token = self.config.get('instagram_access_token', None)
         self.user_id = self.config.get('instagram_user_id', None)
+        
+        # Shared session so the many Graph calls reuse pooled connections;
+        # idempotent requests are retried on transient server errors, and the last
+        # response is returned (not raised) so the status_code checks still apply
+        self.http = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                      raise_on_status=False)
+        self.http.mount("https://", HTTPAdapter(max_retries=retry))
 
         # Validate required configuration
         if not self.access_token:
@@ -53,6 +91,9 @@ class InstagramAnalyticsManager:
         self.max_comments_per_media = self.config.get('max_comments_per_media', 9)
         self.max_replies_per_comment = self.config.get('max_replies_per_comment', 9)
         
+        # Token scopes and expiry change over hours or days, so debug_token results are reused briefly
+        self.permissions_cache_ttl = self.config.get('instagram_permissions_cache_ttl', 300)
+        
         # Find Instagram Business Account through Facebook pages
         self.instagram_account_id = self.user_id
         self.page_access_token = self.access_token
@@ -84,7 +125,7 @@ class InstagramAnalyticsManager:
             url = f"{self.base_url}/{self.user_id}/accounts"
             params = {"access_token": self.access_token}
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code == 200:
                 accounts_data = response.json()
                 
@@ -100,7 +141,7 @@ class InstagramAnalyticsManager:
                             "access_token": page_token
                         }
                         
-                        ig_response = requests.get(ig_url, params=ig_params)
+                        ig_response = self.http.get(ig_url, params=ig_params, timeout=_REQUEST_TIMEOUT)
                         if ig_response.status_code == 200:
                             ig_data = ig_response.json()
                             if ig_data.get('instagram_business_account'):
@@ -115,6 +156,28 @@ class InstagramAnalyticsManager:
         except Exception as e:
             Logger.error(f"Failed to find Instagram account: {e}")
     
+    def _batch_get(self, relative_urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send GET requests through the Graph API batch endpoint, one round-trip per 50 requests.
+        
+        Args:
+            relative_urls: Graph paths with query strings, relative to the API version (no access token)
+            
+        Returns:
+            One {'code': ..., 'body': ...} dict per URL in order, or None where Graph didn't run that request
+        """
+        results = []
+        for start in range(0, len(relative_urls), _GRAPH_BATCH_LIMIT):
+            batch = [{"method": "GET", "relative_url": relative_url}
+                     for relative_url in relative_urls[start:start + _GRAPH_BATCH_LIMIT]]
+            response = self.http.post(self.base_url, data={
+                "access_token": self.page_access_token,
+                "batch": json.dumps(batch)
+            }, timeout=_BATCH_TIMEOUT)
+            response.raise_for_status()
+            results.extend(response.json())
+        return results
+    
     def check_token_permissions(self) -> Dict[str, Any]:
         """
         Check the permissions and scopes available on the current access token.
@@ -123,6 +186,11 @@ class InstagramAnalyticsManager:
         Returns:
             Dictionary containing comprehensive token permission information
         """
+        cached = InstagramAnalyticsManager._permissions_cache.get(self.access_token)
+        if cached and time.monotonic() - cached[0] < self.permissions_cache_ttl:
+            Logger.debug("Using cached token permissions")
+            return cached[1]
+        
         Logger.info("🔍 Checking token permissions and scopes...")
         
         try:
@@ -132,7 +200,7 @@ class InstagramAnalyticsManager:
                 "access_token": self.access_token
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 Logger.error(f"❌ Failed to check token permissions: {response.status_code} - {response.text}")
                 return {
@@ -153,18 +221,9 @@ class InstagramAnalyticsManager:
             data = token_data['data']
             available_scopes = data.get('scopes', [])
             
-            # Define required scopes for Instagram operations
-            required_scopes = [
-                'instagram_basic',
-                'instagram_content_publish', 
-                'instagram_manage_comments',
-                'instagram_manage_insights',
-                'pages_read_engagement',
-                'pages_manage_metadata'
-            ]
-            
             # Find missing scopes
-            missing_scopes = [scope for scope in required_scopes if scope not in available_scopes]
+            available_scope_set = set(available_scopes)
+            missing_scopes = [scope for scope in _REQUIRED_SCOPES if scope not in available_scope_set]
             
             # Check if we have Instagram Business Account access
             has_instagram_access = 'instagram_basic' in available_scopes
@@ -296,6 +355,7 @@ class InstagramAnalyticsManager:
             # Summary
             Logger.info(f"📊 Summary: {len(available_scopes)} scopes available, {len(missing_scopes)} missing, Instagram access: {'✅' if has_instagram_access else '❌'}")
             
+            InstagramAnalyticsManager._permissions_cache[self.access_token] = (time.monotonic(), permission_info)
             return permission_info
             
         except Exception as e:
@@ -309,6 +369,7 @@ class InstagramAnalyticsManager:
     def test_available_fields(self) -> Dict[str, Any]:
         """
         Test different field combinations to see what's available from Instagram API.
+        Diagnostic only (--fulltest); get_account_info() already requests the full field set.
         
         Returns:
             Dictionary containing test results for different field combinations
@@ -330,17 +391,18 @@ class InstagramAnalyticsManager:
         
         results = {}
         
-        for fields in field_combinations:
+        # All field combinations go out in one batch call instead of one request each
+        try:
+            entries = self._batch_get([f"{self.instagram_account_id}?{urlencode({'fields': fields})}"
+                                       for fields in field_combinations])
+        except Exception as e:
+            return {fields: {'status': 'exception', 'error': str(e)} for fields in field_combinations}
+        
+        for fields, entry in zip(field_combinations, entries):
+            entry = entry or {}
             try:
-                url = f"{self.base_url}/{self.instagram_account_id}"
-                params = {
-                    "fields": fields,
-                    "access_token": self.page_access_token
-                }
-                
-                response = requests.get(url, params=params)
-                if response.status_code == 200:
-                    data = response.json()
+                if entry.get('code') == 200:
+                    data = json.loads(entry['body'])
                     results[fields] = {
                         'status': 'success',
                         'fields_returned': list(data.keys()),
@@ -349,8 +411,8 @@ class InstagramAnalyticsManager:
                 else:
                     results[fields] = {
                         'status': 'error',
-                        'status_code': response.status_code,
-                        'error': response.text
+                        'status_code': entry.get('code'),
+                        'error': entry.get('body') or ''
                     }
                     
             except Exception as e:
@@ -364,6 +426,7 @@ class InstagramAnalyticsManager:
     def test_insights_configurations(self) -> Dict[str, Any]:
         """
         Test specific insights API configurations for all supported metrics and periods.
+        Diagnostic only (--fulltest); get_account_insights() only requests the known-good ones.
         
         Returns:
             Dictionary containing test results for different configurations
@@ -388,6 +451,7 @@ class InstagramAnalyticsManager:
         periods_to_test = ["day", "week", "days_28"]
         
         results = {}
+        configs = []
         
         for metric in metrics_to_test:
             for period in periods_to_test:
@@ -403,29 +467,34 @@ class InstagramAnalyticsManager:
                         "metric": metric,
                         "period": period
                     }
-                
-                try:
-                    url = f"{self.base_url}/{self.instagram_account_id}/insights"
-                    params = {
-                        "access_token": self.page_access_token,
-                        **config
-                    }
-                    
-                    response = requests.get(url, params=params)
-                    results[f"{metric}_{period}"] = {
-                        'status_code': response.status_code,
-                        'success': response.status_code == 200,
-                        'response': response.text[:200] if response.status_code != 200 else 'Success',
-                        'config': config
-                    }
-                    
-                except Exception as e:
-                    results[f"{metric}_{period}"] = {
-                        'status_code': 'Exception',
-                        'success': False,
-                        'response': str(e),
-                        'config': config
-                    }
+                configs.append(config)
+        
+        # All configurations go out in one batch call instead of one request each
+        try:
+            entries = self._batch_get([f"{self.instagram_account_id}/insights?{urlencode(config)}" for config in configs])
+        except Exception as e:
+            entries = None
+            batch_error = str(e)
+        
+        for i, config in enumerate(configs):
+            key = f"{config['metric']}_{config['period']}"
+            if entries is None:
+                results[key] = {
+                    'status_code': 'Exception',
+                    'success': False,
+                    'response': batch_error,
+                    'config': config
+                }
+                continue
+            
+            entry = entries[i] or {}
+            status_code = entry.get('code')
+            results[key] = {
+                'status_code': status_code,
+                'success': status_code == 200,
+                'response': (entry.get('body') or '')[:200] if status_code != 200 else 'Success',
+                'config': config
+            }
         
         return results
     
@@ -441,7 +510,6 @@ class InstagramAnalyticsManager:
         
         try:
             # Aggregate insights across multiple valid configurations and periods
-            url = f"{self.base_url}/{self.instagram_account_id}/insights"
             aggregated: Dict[str, Dict[str, Any]] = {}
             
             # Define per-metric rules to maximize success based on test results
@@ -457,39 +525,43 @@ class InstagramAnalyticsManager:
                 {"name": "comments", "periods": ["day", "week", "days_28"], "extra": {"metric_type": "total_value"}}
             ]
             
+            # Every (metric, period) pair goes out in a single batch call
+            queries = []
             for metric in metrics_info:
-                metric_name = metric["name"]
                 for period in metric["periods"]:
                     params = {
-                        "metric": metric_name,
+                        "metric": metric["name"],
                         "period": period,
-                        "access_token": self.page_access_token,
                         **metric.get("extra", {})
                     }
-                    response = requests.get(url, params=params)
-                    if response.status_code != 200:
-                        Logger.debug(f"Insights request failed metric={metric_name} period={period}: {response.status_code} - {response.text}")
-                        continue
-                    insights_data = response.json()
-                    Logger.debug(f"Insights response for {metric_name} {period}: {insights_data}")
-                    for insight in insights_data.get('data', []):
-                        name = insight.get('name')
-                        if name not in aggregated:
-                            aggregated[name] = {}
-                        # Prefer total_value, otherwise take the last value in 'values'
-                        value_to_store = None
-                        total_value = insight.get('total_value')
-                        if isinstance(total_value, dict) and 'value' in total_value:
-                            value_to_store = total_value['value']
-                        else:
-                            values = insight.get('values') or []
-                            if len(values) > 0 and 'value' in values[-1]:
-                                value_to_store = values[-1]['value']
-                        if value_to_store is not None:
-                            aggregated[name][period] = value_to_store
-                            Logger.debug(f"Stored {name}[{period}] = {value_to_store}")
-                        else:
-                            Logger.debug(f"No value found for {name} {period}, insight: {insight}")
+                    queries.append((metric["name"], period, f"{self.instagram_account_id}/insights?{urlencode(params)}"))
+            
+            entries = self._batch_get([relative_url for _, _, relative_url in queries])
+            
+            for (metric_name, period, _), entry in zip(queries, entries):
+                if not entry or entry.get('code') != 200:
+                    Logger.debug(f"Insights request failed metric={metric_name} period={period}: {entry.get('code') if entry else None} - {entry.get('body') if entry else 'no response'}")
+                    continue
+                insights_data = json.loads(entry['body'])
+                Logger.debug(f"Insights response for {metric_name} {period}: {insights_data}")
+                for insight in insights_data.get('data', []):
+                    name = insight.get('name')
+                    if name not in aggregated:
+                        aggregated[name] = {}
+                    # Prefer total_value, otherwise take the last value in 'values'
+                    value_to_store = None
+                    total_value = insight.get('total_value')
+                    if isinstance(total_value, dict) and 'value' in total_value:
+                        value_to_store = total_value['value']
+                    else:
+                        values = insight.get('values') or []
+                        if len(values) > 0 and 'value' in values[-1]:
+                            value_to_store = values[-1]['value']
+                    if value_to_store is not None:
+                        aggregated[name][period] = value_to_store
+                        Logger.debug(f"Stored {name}[{period}] = {value_to_store}")
+                    else:
+                        Logger.debug(f"No value found for {name} {period}, insight: {insight}")
             
             Logger.info(f"Successfully aggregated {len(aggregated)} metrics: {list(aggregated.keys())}")
             for metric, periods in aggregated.items():
@@ -531,7 +603,7 @@ class InstagramAnalyticsManager:
                 "access_token": self.page_access_token
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 Logger.error(f"Failed to retrieve Instagram account info: {response.status_code} - {response.text}")
                 # Fallback to basic info
@@ -582,14 +654,20 @@ class InstagramAnalyticsManager:
         """
         Logger.info("Retrieving comprehensive Instagram account information")
         
-        # Get basic account info
-        account_info = self.get_account_info()
-        
-        # Check token permissions
-        permissions = self.check_token_permissions()
+        # The three lookups are independent Graph calls, so wait on them together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Get basic account info
+            account_info_future = executor.submit(self.get_account_info)
+            
+            # Check token permissions
+            permissions_future = executor.submit(self.check_token_permissions)
+            
+            # Get recent media count
+            recent_media_future = executor.submit(self.get_recent_media, limit=1)
         
-        # Get recent media count
-        recent_media = self.get_recent_media(limit=1)
+        account_info = account_info_future.result()
+        permissions = permissions_future.result()
+        recent_media = recent_media_future.result()
         media_count = len(recent_media) if recent_media else 0
         
         # Combine all information
@@ -643,7 +721,7 @@ class InstagramAnalyticsManager:
                 "limit": limit
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 Logger.error(f"Failed to retrieve Instagram media: {response.status_code} - {response.text}")
                 return []
@@ -707,7 +785,7 @@ class InstagramAnalyticsManager:
                 "limit": self.max_comments_per_media
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 Logger.debug(f"Failed to retrieve comments for media {media_id}: {response.status_code} - {response.text}")
                 return []
@@ -760,7 +838,7 @@ class InstagramAnalyticsManager:
                 "limit": self.max_replies_per_comment
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 Logger.debug(f"Failed to retrieve replies for comment {comment_id}: {response.status_code} - {response.text}")
                 return []
@@ -825,7 +903,7 @@ class InstagramAnalyticsManager:
                 # Note: period is automatically set to "lifetime" by Instagram API
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 Logger.debug(f"Failed to retrieve insights for media {media_id}: {response.status_code} - {response.text}")
                 return {}
@@ -863,7 +941,7 @@ class InstagramAnalyticsManager:
                 "access_token": self.access_token
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             insights_data = response.json()
             
@@ -899,7 +977,7 @@ class InstagramAnalyticsManager:
                 "limit": limit
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
             comments_data = response.json()
             
@@ -946,7 +1024,7 @@ class InstagramAnalyticsManager:
                 "limit": limit
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params, timeout=_REQUEST_TIMEOUT)
             if response.status_code != 200:
                 Logger.error(f"Failed to retrieve Instagram activity: {response.status_code} - {response.text}")
                 return []
@@ -7,10 +7,12 @@ from datetime import datetime
 import sys
 from pathlib import Path
 
-# Add the parent directory to Python path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add the parent directory to Python path to import config (once per process)
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-from config import ConfigManager
+from config import get_config
 
 # Try importing logger from autopotter_tools first, fallback to local import
 try:
@@ -22,7 +24,7 @@ except ImportError:
 class InstagramVideoUploader:
     def __init__(self, config_path="autopost_config.enhanced.json", log_file=None):
         # self.log_file = log_file
-        self.config_manager = ConfigManager(config_path)
+        self.config_manager = get_config(config_path)
         # self.config = self.config_manager.get_instagram_config()
 
         self.access_token = self.config_manager.get('instagram_access_token', None)
@@ -65,15 +67,16 @@ class InstagramVideoUploader:
         return response_data.get("id"), response_data.get("uri")
 
     def upload_video(self, creation_id, video_path):
-        file_size = os.path.getsize(video_path)
         url = f"https://rupload.facebook.com/ig-api-upload/v22.0/{creation_id}"
-        headers = {
-            "Authorization": f"OAuth {self.access_token}",
-            "offset": "0",
-            "file_size": str(file_size)
-        }
-        
+
         with open(video_path, "rb") as video_file:
+            # fstat on the open handle instead of a second path-based stat
+            file_size = os.fstat(video_file.fileno()).st_size
+            headers = {
+                "Authorization": f"OAuth {self.access_token}",
+                "offset": "0",
+                "file_size": str(file_size)
+            }
             response = requests.post(url, headers=headers, data=video_file)
         
         return response.json()
@@ -87,7 +90,7 @@ class InstagramVideoUploader:
         response = requests.post(url, data=payload)
         return response.json()
 
-    def publish_from_url(self, video_url, video_caption):
+    def publish_from_url(self, video_url, video_caption, thumbnail_offset=None):
         """
         Publish a reel directly from a video URL using Instagram Graph API.
         This method follows the Instagram API documentation for reels.
@@ -95,6 +98,7 @@ class InstagramVideoUploader:
         Args:
             video_url (str): Public URL to the video file
             video_caption (str): Caption for the reel
+            thumbnail_offset (int): Optional thumbnail offset in milliseconds
             
         Returns:
             dict: API response with success status and details
@@ -110,8 +114,10 @@ class InstagramVideoUploader:
                 "video_url": video_url,
                 "caption": video_caption,
                 "access_token": self.access_token,
-                # "thumb_offset": 5000
             }
+            if thumbnail_offset:
+                container_payload["thumb_offset"] = thumbnail_offset
+                self.log_message(f"Adding Thumbnail Offset: {thumbnail_offset}")
             
             self.log_message("Creating reel container...")
             container_response = requests.post(container_url, data=container_payload)
@@ -14,10 +14,12 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
-# Add the parent directory to Python path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add the parent directory to Python path to import config (once per process)
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-from config import ConfigManager
+from config import get_config
 
 
 class InstagramHashtagSearcher:
@@ -25,7 +27,7 @@ class InstagramHashtagSearcher:
     
     def __init__(self, config_path: str = "autopost_config.enhanced.json"):
         """Initialize with configuration."""
-        self.config_manager = ConfigManager(config_path)
+        self.config_manager = get_config(config_path)
         self.config = self.config_manager.config  # Always use full config
         self.base_url = "https://graph.facebook.com/v23.0"
         
@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import os
@@ -9,10 +11,12 @@ import tempfile
 import sys
 from pathlib import Path
 
-# Add the parent directory to Python path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add the parent directory to Python path to import config (once per process)
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
-from config import ConfigManager
+from config import get_config
 
 # Try importing logger from autopotter_tools first, fallback to local import
 try:
@@ -28,18 +32,31 @@ class Json2VideoAPI:
     """
     
     def __init__(self, config_path="autopost_config.enhanced.json"):
-        self.config_manager = ConfigManager(config_path)
+        self.config_manager = get_config(config_path)
         
         # Initialize API settings from config
         self.api_key = self.config_manager.config["json2video_api_key"]
         self.base_url = self.config_manager.config["json2video_base_url"]
         self.timeout = self.config_manager.config["json2video_timeout"]
         
+        # Status polling starts fast for short renders and backs off to the max interval
+        self.poll_interval_start = self.config_manager.get("json2video_poll_interval_start", 2)
+        self.poll_interval_max = self.config_manager.get("json2video_poll_interval_max", 10)
+        
         self.headers = {
             "Content-Type": "application/json",
             "x-api-key": self.api_key
         }
         
+        # Shared session so status polls and the download reuse one connection;
+        # idempotent requests are retried on transient gateway errors, and the last
+        # response is returned (not raised) so its status and body still get logged
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                      raise_on_status=False)
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+        self.session.mount("http://", HTTPAdapter(max_retries=retry))
+        
         # Validate API key
         if not self.api_key or self.api_key.startswith("${"):
             error_msg = "Please set your json2video API key in the config file"
@@ -54,7 +71,7 @@ class Json2VideoAPI:
             Logger.info("Testing connection to json2video API...")
             
             url = f"{self.base_url}/movies"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             
             if response.status_code == 200:
                 Logger.info("API connection successful")
@@ -79,7 +96,7 @@ class Json2VideoAPI:
             url = f"{self.base_url}/movies"
             Logger.info("Creating video with API...")
             
-            response = requests.post(url, headers=self.headers, json=video_config)
+            response = self.session.post(url, headers=self.headers, json=video_config)
             response.raise_for_status()
             
             result = response.json()
@@ -103,6 +120,7 @@ class Json2VideoAPI:
     def wait_for_completion(self, project_id):
         """Wait for video creation to complete"""
         start_time = time.time()
+        poll_interval = self.poll_interval_start
         Logger.info(f"Waiting for project {project_id} to complete...")
         
         # Note: We don't validate project existence upfront because newly created projects
@@ -152,14 +170,14 @@ class Json2VideoAPI:
                     Logger.error(error_msg)
                     raise Exception(error_msg)
                 elif status in ['pending', 'processing', 'running']:
-                    Logger.debug(f"Still {status}... waiting 10 seconds")
-                    time.sleep(10)
+                    Logger.debug(f"Still {status}... waiting {poll_interval:g} seconds")
                 elif status == 'not_found_yet':
-                    Logger.debug(f"Project {project_id} not found yet (may be newly created), waiting 10 seconds")
-                    time.sleep(10)
+                    Logger.debug(f"Project {project_id} not found yet (may be newly created), waiting {poll_interval:g} seconds")
                 else:
-                    Logger.warning(f"Unknown status: {status}, waiting 10 seconds")
-                    time.sleep(10)
+                    Logger.warning(f"Unknown status: {status}, waiting {poll_interval:g} seconds")
+                
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 1.5, self.poll_interval_max)
                     
             except Exception as e:
                 Logger.error(f"Error checking status: {e}")
@@ -178,7 +196,7 @@ class Json2VideoAPI:
             params = {"project": project_id}
             
             Logger.debug(f"Getting project status for {project_id}")
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             
             result = response.json()
@@ -221,12 +239,24 @@ class Json2VideoAPI:
             
             # Download the video
             Logger.info(f"Downloading video to: {output_path}")
-            response = requests.get(download_url, stream=True)
+            response = self.session.get(download_url, stream=True)
             response.raise_for_status()
             
             with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                # Reserve the full file up front when the size is known to avoid fragmentation
+                content_length = int(response.headers.get('Content-Length', 0) or 0)
+                if content_length and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, content_length)
+                    except OSError as e:
+                        Logger.debug(f"Could not preallocate {output_path}: {e}")
+
+                # 1 MiB chunks keep the Python-level loop short for multi-MB videos
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
                     f.write(chunk)
+
+                # Drop any preallocated tail if the decoded body was shorter than Content-Length
+                f.truncate()
             
             Logger.info(f"Video downloaded successfully to: {output_path}")
             return output_path
@@ -4,7 +4,6 @@ Quick test script to load autodraft output and convert json2video_config_str to
 """
 
 import json
-import re
 from pathlib import Path
 
 # Try importing logger from autopotter_tools first, fallback to local import
@@ -14,6 +13,10 @@ except ImportError:
     from simplelogger import Logger
 
 
+# Deletion table for C0/C1 control characters, used by str.translate instead of a regex
+_CONTROL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x20), *range(0x7f, 0xa0)])
+
+
 # class JSON2VideoConfigParseError(Exception):
 #     """Exception raised when json2video config parsing fails."""
 #     pass
@@ -47,7 +50,7 @@ def parse_json2video_config(config_str, video_title="Unknown"):
     # Define repair strategies with their descriptions
     repair_strategies = [
         (lambda s: s, "direct parsing"),
-        (lambda s: re.sub(r'[\x00-\x1f\x7f-\x9f]', '', s), "control character removal"),
+        (lambda s: s.translate(_CONTROL_CHARS_TABLE), "control character removal"),
         (lambda s: s[s.find('{'):s.rfind('}')+1] if s.find('{') != -1 and s.rfind('}') > s.find('{') else s, "JSON extraction"),
         (lambda s: s.replace('\\"', '"').replace('\\n', '\n'), "escaped character fixing")
     ]
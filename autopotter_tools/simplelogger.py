@@ -1,23 +1,36 @@
+import atexit
 import datetime
-import inspect
+import sys
+import threading
 
 class Logger:
     """Ultra-simple logger with static methods."""
     
     _logfile_path = None
+    _logfile = None
     _logtime = None
     _loglevel = 2
+    
+    # Serializes opening, writing and closing the shared log file across threads
+    _lock = threading.Lock()
 
     @staticmethod
     def setup(logfile_path = None, logtime = None, loglevel = None):
+        if logfile_path and logfile_path != Logger._logfile_path:
+            Logger.close()
         Logger._logfile_path = logfile_path if logfile_path else Logger._logfile_path
         Logger._logtime = logtime if logtime else (Logger._logtime if Logger._logtime else datetime.datetime.now())
         if loglevel is not None:
-            # Convert string level name to number if needed
-            if isinstance(loglevel, str):
-                Logger._loglevel = Logger.LEVELS.get(loglevel.upper(), Logger._loglevel)
-            else:
-                Logger._loglevel = loglevel
+            Logger.set_level(loglevel)
+
+    @staticmethod
+    def set_level(loglevel):
+        """Change the log level in place; the open log file handle is left untouched."""
+        # Convert string level name to number if needed
+        if isinstance(loglevel, str):
+            Logger._loglevel = Logger.LEVELS.get(loglevel.upper(), Logger._loglevel)
+        else:
+            Logger._loglevel = loglevel
 
 
     LEVELS = {
@@ -36,27 +49,44 @@ class Logger:
 
     @staticmethod
     def log(msg, level='info'):
-        if Logger.LEVELS[level.upper()] < Logger._loglevel:
+        level = level.upper()
+        if Logger.LEVELS[level] < Logger._loglevel:
             return
         
-        frame = inspect.currentframe().f_back.f_back
+        # Skip log() and the level wrapper to reach the real caller
+        try:
+            frame = sys._getframe(2)
+        except ValueError:
+            frame = None
         if not frame:
             caller_name = "unknown"
         else:
             # Try to get class name if called from a method
             caller_name = frame.f_code.co_name
-            if 'self' in frame.f_locals:
-                class_name = frame.f_locals['self'].__class__.__name__
-                caller_name = f"{class_name}.{caller_name}"
+            caller_self = frame.f_locals.get('self')
+            if caller_self is not None:
+                caller_name = f"{type(caller_self).__name__}.{caller_name}"
 
-        logtext = f"[ {caller_name} ] {Logger.LEVEL_EMOJIS[level.upper()]}   {msg}"
+        logtext = f"[ {caller_name} ] {Logger.LEVEL_EMOJIS[level]}   {msg}"
 
         if Logger._logfile_path:
-            with open(Logger._logfile_path, 'a') as f:
-                f.write(logtext + '\n')
+            with Logger._lock:
+                # Keep one handle open for the run instead of reopening per message; it is
+                # line-buffered so every line is on disk even if the process is killed
+                if Logger._logfile is None:
+                    Logger._logfile = open(Logger._logfile_path, 'a', buffering=1)
+                Logger._logfile.write(logtext + '\n')
         else:
             print(logtext)
 
+    @staticmethod
+    def close():
+        """Flush and close the log file handle, if one is open."""
+        with Logger._lock:
+            if Logger._logfile is not None:
+                Logger._logfile.close()
+                Logger._logfile = None
+
     @staticmethod
     def debug(msg): 
         Logger.log(msg, 'DEBUG')
@@ -73,6 +103,8 @@ class Logger:
     def error(msg): 
         Logger.log(msg, 'ERROR')
 
+atexit.register(Logger.close)
+
 # Usage:
 #SimpleLogger.info("Message here")
 #SimpleLogger.error("Error here")
\ No newline at end of file
@@ -9,15 +9,15 @@ Minimal script that orchestrates the entire workflow:
 import json
 import os
 import sys
+import random
 import argparse
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from autopotter_tools.simplelogger import Logger
 
 from enhanced_autodraft import main_autodraft
 from autopotter_tools.json2video_manager import Json2VideoAPI
-from autopotter_tools.instagram_api import InstagramVideoUploader
-from autopotter_tools.instagram_analytics import InstagramAnalyticsManager
 
 
 def run_autopotter_workflow(config_file, outfile, prompt_override, video_outfile, video_draft_only):
@@ -33,14 +33,18 @@ def run_autopotter_workflow(config_file, outfile, prompt_override, video_outfile
     
     try:
         # Load config to check for analytics reload option
-        from config import ConfigManager
-        config = ConfigManager(config_file)
+        from config import get_config
+        config = get_config(config_file)
+        
+        # Let Instagram fetch the rendered video from json2video instead of downloading it first
+        publish_from_url = config.get('autopost_publish_from_url', False) and not video_draft_only
         
 
         ####### STEP 0.5: Reload Instagram analytics if configured #######
         if config.get('autopost_reload_ig_analytics', False):
             Logger.info("\n📊 Step 1.5: Reloading Instagram analytics...")
             try:
+                from autopotter_tools.instagram_analytics import InstagramAnalyticsManager
                 analytics_manager = InstagramAnalyticsManager(config_file)
                 analytics_output = config.get('gpt_responses_other_files_to_include', None)['ig_analytics']
                 analytics_manager.export_to_json(analytics_output)
@@ -52,9 +56,23 @@ def run_autopotter_workflow(config_file, outfile, prompt_override, video_outfile
             Logger.info("\n⏭️  Skipping Instagram analytics reload (autopost_reload_ig_analytics = false)")
         
 
+        # Build the Instagram uploader before any GPT or render work so a missing
+        # token or user ID fails the run immediately instead of after a paid render
+        instagram_uploader = None
+        if not video_draft_only:
+            from autopotter_tools.instagram_api import InstagramVideoUploader
+            instagram_uploader = InstagramVideoUploader(config_file)
+        
+
         ####### STEP 1: Run enhanced_autodraft #######
-        Logger.info("\n📝 Step 1: Running enhanced_autodraft...")
-        main_autodraft(outfile, config_file, prompt_override)
+        # The json2video connection test doesn't depend on the draft, so run it
+        # alongside the GPT call to overlap their network waits
+        json2video_api = Json2VideoAPI(config_file)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            connection_future = executor.submit(json2video_api.test_connection)
+            
+            Logger.info("\n📝 Step 1: Running enhanced_autodraft...")
+            main_autodraft(outfile, config_file, prompt_override)
         
         # Load the autodraft output
         with open(outfile, 'r') as f:
@@ -78,19 +96,17 @@ def run_autopotter_workflow(config_file, outfile, prompt_override, video_outfile
         
         # Step 2: Upload to json2video
         Logger.info("\n🎬 Step 2: Uploading to json2video...")
-        json2video_api = Json2VideoAPI(config_file)
         
-        # Test connection first
-        if not json2video_api.test_connection():
+        # Check the connection test that ran during autodraft
+        if not connection_future.result():
             raise Exception("Failed to connect to json2video API")
         
         
         # Try videos until one succeeds
-        import random
         video_success = False
         while available_videos and not video_success:
-            # Randomly select one video and its corresponding config
-            selected_index = random.randint(0, len(available_videos) - 1)
+            # Randomly select one video and its corresponding config (index is needed to pop both lists)
+            selected_index = random.randrange(len(available_videos))
             selected_video = available_videos[selected_index]
             selected_json2vid_config = available_configs[selected_index]
             
@@ -122,15 +138,20 @@ def run_autopotter_workflow(config_file, outfile, prompt_override, video_outfile
                 Logger.info(f"⏱️  Duration: {movie_info.get('duration')} seconds")
                 Logger.info(f"📐 Dimensions: {movie_info.get('width')}x{movie_info.get('height')}")
                 Logger.info(f"💾 File size: {movie_info.get('size')}")
-                Logger.info(f"🔗 Video URL: {movie_info.get('url')}")
+                video_url = movie_info.get('url')
+                Logger.info(f"🔗 Video URL: {video_url}")
 
                 if video_duration < 2:
                     raise Exception("❌ Video duration is less than 2 seconds")
                 
-                # Download the video to the specified output file
-                Logger.info(f"\nDownloading video to: {video_outfile}")
-                video_path = json2video_api.download_video(project_id, video_outfile)
-                Logger.info(f"✅ Video downloaded to: {video_path}")
+                if publish_from_url and video_url:
+                    Logger.info("⏭️  Skipping video download (autopost_publish_from_url = true)")
+                    video_path = None
+                else:
+                    # Download the video to the specified output file
+                    Logger.info(f"\nDownloading video to: {video_outfile}")
+                    video_path = json2video_api.download_video(project_id, video_outfile)
+                    Logger.info(f"✅ Video downloaded to: {video_path}")
                 
                 video_success = True
                 
@@ -155,10 +176,12 @@ def run_autopotter_workflow(config_file, outfile, prompt_override, video_outfile
         
         # Step 3: Upload to Instagram
         Logger.info("\n📱 Step 3: Uploading to Instagram...")
-        instagram_uploader = InstagramVideoUploader(config_file)
         thumbnail_offset = int( (video_duration*1000 * .9 ) )
         Logger.info(f"Uploading video with caption: {selected_caption[:100]}...")
-        upload_result = instagram_uploader.upload_and_publish(video_path, selected_caption, thumbnail_offset)
+        if video_path is None:
+            upload_result = instagram_uploader.publish_from_url(video_url, selected_caption, thumbnail_offset)
+        else:
+            upload_result = instagram_uploader.upload_and_publish(video_path, selected_caption, thumbnail_offset)
         
         if not upload_result is True:
             Logger.error("Failed to upload video to Instagram")
@@ -167,7 +190,7 @@ def run_autopotter_workflow(config_file, outfile, prompt_override, video_outfile
         Logger.info("✅ Video uploaded to Instagram successfully!")
         
         # Cleanup temporary file after Instagram upload
-        if os.path.exists(video_path):
+        if video_path and os.path.exists(video_path):
             os.remove(video_path)
             Logger.info(f"🧹 Cleaned up temporary file: {video_path}")
         
@@ -1,10 +1,22 @@
 import os
 import json
 import re
+import functools
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Union
 from autopotter_tools.simplelogger import Logger
 
+# Keys whose values are masked when the configuration is printed, mapped to
+# how many leading characters stay visible
+SENSITIVE_KEYS = {
+    'instagram_app_secret': 8,
+    'instagram_access_token': 8,
+    'openai_api_key': 8,
+    'json2video_api_key': 8,
+    'gcs_api_key_path': 20,
+}
+
 class ConfigManager:
     """
     Simple configuration management for the enhanced video generation system.
@@ -15,6 +27,9 @@ class ConfigManager:
         self.config_path = config_path
         self.temp_config_path = config_path.replace('.json', '.temp.json')
         self.config = {}
+        self._gcs_config_cache = None
+        self._batch_depth = 0
+        self._pending_temp_values = {}
         self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
@@ -52,6 +67,7 @@ class ConfigManager:
             
             # Resolve environment variables
             self.config = self.resolve_environment_variables(self.config)
+            self._gcs_config_cache = None
             
             Logger.info("Configuration loaded successfully")
             return self.config
@@ -70,34 +86,79 @@ class ConfigManager:
         
         return self.config.get(key, default)
     
+    def get_gcs_config(self) -> Dict[str, Any]:
+        """Get the gcs_* settings with the prefix stripped (e.g. 'bucket', 'api_key_path')."""
+        if self._gcs_config_cache is None:
+            self._gcs_config_cache = {
+                key[len('gcs_'):]: value
+                for key, value in self.config.items()
+                if key.startswith('gcs_')
+            }
+        return self._gcs_config_cache
+    
     def set(self, key: str, value: Any):
         """Set a configuration value and save to temporary config file."""
         try:
             # Update in-memory configuration
             self.config[key] = value
+            self._gcs_config_cache = None
             
-            # Load existing temp config if it exists
-            temp_config = {}
-            if os.path.exists(self.temp_config_path):
-                try:
-                    with open(self.temp_config_path, 'r') as f:
-                        temp_config = json.load(f)
-                except Exception as e:
-                    Logger.warning(f"Could not read existing temp config file: {e}")
-            
-            # Update temp config with new value
-            temp_config[key] = value
+            # Later get_config() calls must re-read the temp file
+            _load_config.cache_clear()
             
-            # Save to temporary config file
-            with open(self.temp_config_path, 'w') as f:
-                json.dump(temp_config, f, indent=4)
+            # Inside batch() the write is deferred until the outermost block exits
+            if self._batch_depth:
+                self._pending_temp_values[key] = value
+                return
             
-            Logger.info(f"Configuration value '{key}' set and saved to temporary config: {self.temp_config_path}")
+            self._save_temp_config({key: value})
             
         except Exception as e:
             Logger.error(f"Failed to set configuration value '{key}': {e}")
             raise
     
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into a single temporary config write."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_temp_values:
+                pending, self._pending_temp_values = self._pending_temp_values, {}
+                self._save_temp_config(pending)
+    
+    def _save_temp_config(self, values: Dict[str, Any]):
+        """Merge values into the temporary config file, writing only if something changed."""
+        # Load existing temp config if it exists
+        temp_config = {}
+        if os.path.exists(self.temp_config_path):
+            try:
+                with open(self.temp_config_path, 'r') as f:
+                    temp_config = json.load(f)
+            except Exception as e:
+                Logger.warning(f"Could not read existing temp config file: {e}")
+        
+        # Nothing to persist if the temp file already holds these values
+        changed = {key: value for key, value in values.items()
+                   if key not in temp_config or temp_config[key] != value}
+        if not changed:
+            Logger.debug(f"Configuration values {list(values)} unchanged; skipping temp config write")
+            return
+        
+        # Update temp config with new values
+        temp_config.update(changed)
+        
+        # Write to a sibling file and rename it into place so an interrupted
+        # save can never leave a truncated temp config behind
+        staging_path = self.temp_config_path + '.tmp'
+        with open(staging_path, 'w') as f:
+            json.dump(temp_config, f, indent=4)
+        os.replace(staging_path, self.temp_config_path)
+        
+        Logger.info(f"Configuration value(s) {list(changed)} set and saved to temporary config: {self.temp_config_path}")
+    
     def load_dotenv(self, env_file_path: str = ".env") -> bool:
         """
         Load environment variables from a .env file.
@@ -180,6 +241,7 @@ class ConfigManager:
             "gcs_api_key_path": "your_gcs_api_key_path",
             "gcs_folders": ["video_uploads", "music_uploads", "completed_works", "wip_photos", "build_photos"],
             "gcs_draft_folder": "draft_videos",
+            "gcs_upload_workers": 16,
             
             # OpenAI Configuration
             "openai_api_key": "${OPENAI_API_KEY}",
@@ -399,13 +461,32 @@ class ConfigManager:
             return True  # Assume expired if there's an error
     
 
+def _mtime(path: str) -> Optional[float]:
+    """Modification time of path, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config(config_path: str, config_mtime: Optional[float], temp_mtime: Optional[float]) -> ConfigManager:
+    """Build a ConfigManager; the mtimes only key the cache so on-disk edits force a reload."""
+    return ConfigManager(config_path)
+
+
 # Convenience function for getting configuration
 def get_config(config_path: str = "autopost_config.enhanced.json") -> ConfigManager:
-    """Get a configuration manager instance."""
-    return ConfigManager(config_path)
+    """Get the shared configuration manager for a config path, reloaded when its files change."""
+    temp_config_path = config_path.replace('.json', '.temp.json')
+    return _load_config(config_path, _mtime(config_path), _mtime(temp_config_path))
 
 
 if __name__ == "__main__":
     config = get_config()
-    print(json.dumps(config.config, indent=2))
+    masked = {
+        key: (f"{str(value)[:SENSITIVE_KEYS[key]]}..." if value else "Not set") if key in SENSITIVE_KEYS else value
+        for key, value in config.config.items()
+    }
+    print(json.dumps(masked, indent=2))
 
@@ -3,15 +3,14 @@
 Main entrypoint for the enhanced autopost system
 """
 
+import os
 import json
 import argparse
-from pathlib import Path
 from pydantic import BaseModel
 from typing import List
-from config import ConfigManager
+from config import ConfigManager, get_config
 from datetime import datetime
 from autopotter_tools.parse_json2video_configs import parse_json2video_config
-from autopotter_tools.gpt_api import GPTAPI
 from autopotter_tools.simplelogger import Logger
 
 
@@ -34,6 +33,17 @@ class DraftVideoList(BaseModel):
         return [video.get_json2video_config() for video in self.videos]
 
 
+def _compact_json(content: str) -> str:
+    """
+    Re-serialize JSON without indentation or ASCII escaping to cut prompt tokens.
+    Content that doesn't parse is returned unchanged.
+    """
+    try:
+        return json.dumps(json.loads(content), separators=(',', ':'), ensure_ascii=False)
+    except ValueError:
+        return content
+
+
 def resolve_file_inclusions(config: ConfigManager) -> str:
     """
     Resolve gpt_responses_other_files_to_include and replace <<filename>> placeholders
@@ -43,13 +53,15 @@ def resolve_file_inclusions(config: ConfigManager) -> str:
     resolved_text = ""
     
     for key, filepath in other_files.items():
+        # Open directly rather than stat-ing first; a missing file surfaces as FileNotFoundError
         try:
-            if Path(filepath).exists():
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                resolved_text += f"\n\n{key.upper()}:\n{content}"
-            else:
-                Logger.warning(f"File {filepath} not found for {key}")
+            with open(filepath, 'r') as f:
+                content = f.read()
+            if filepath.endswith('.json'):
+                content = _compact_json(content)
+            resolved_text += f"\n\n{key.upper()}:\n{content}"
+        except FileNotFoundError:
+            Logger.warning(f"File {filepath} not found for {key}")
         except Exception as e:
             Logger.error(f"Error reading file {filepath}: {e}")
     
@@ -58,7 +70,7 @@ def resolve_file_inclusions(config: ConfigManager) -> str:
 
 def main_autodraft(outfile, config_file, prompt_override=None, minimal=False):
     # Load configuration first to initialize logging
-    config = ConfigManager(config_file)
+    config = get_config(config_file)
     
     Logger.info(f"Output will be saved to: {outfile}")
     
@@ -82,6 +94,9 @@ def main_autodraft(outfile, config_file, prompt_override=None, minimal=False):
         f.write(full_instructions)
     
     
+    # Imported here so the OpenAI SDK is only loaded once a prompt is actually sent
+    from autopotter_tools.gpt_api import GPTAPI
+    
     # Initialize GPT API with response ID tracking enabled
     api = GPTAPI(
         model=config.get('gpt_model'),
@@ -126,8 +141,9 @@ def main_autodraft(outfile, config_file, prompt_override=None, minimal=False):
 
     # Save response ID to config for future reference (GPTAPI already saved it internally)
     if config.get('gpt_use_previous_response_id'):
-        config.set('gpt_previous_response_id', response.id)
-        config.set('gpt_previous_response_date', datetime.now().isoformat())
+        with config.batch():
+            config.set('gpt_previous_response_id', response.id)
+            config.set('gpt_previous_response_date', datetime.now().isoformat())
     # config.save_config()
 
 
@@ -156,8 +172,12 @@ if __name__ == "__main__":
                        default='resources/autodraft_output.enhanced.json',
                        help='Output file path (default: autodraft.enhanced.json)')
     parser.add_argument('--prompt', '-p',
+                       action='append',
+                       default=None,
+                       help='Custom prompt for GPT (uses config default if not specified); repeat to draft several prompts in one run')
+    parser.add_argument('--prompts-file',
                        default=None,
-                       help='Custom prompt for GPT (uses config default if not specified)')
+                       help='JSONL file with one {"prompt": ...} object per line, drafted after any --prompt values')
     parser.add_argument('--config', '-c',
                        default='autopost_config.enhanced.json',
                        help='Config file path (default: autopost_config.enhanced.json)')
@@ -166,4 +186,16 @@ if __name__ == "__main__":
                        help='Minimal mode: Skip file inclusions and base instructions, only send prompt as user_instruction')
     args = parser.parse_args()
     
-    main_autodraft(args.outfile, args.config, args.prompt, args.minimal)
+    prompts = list(args.prompt or [])
+    if args.prompts_file:
+        with open(args.prompts_file) as f:
+            prompts.extend(json.loads(line)["prompt"] for line in f if line.strip())
+    
+    if len(prompts) <= 1:
+        main_autodraft(args.outfile, args.config, prompts[0] if prompts else None, args.minimal)
+    else:
+        # Several prompts share this process and its OpenAI client; they run in order
+        # so each one can chain from the previous response ID
+        name, ext = os.path.splitext(args.outfile)
+        for idx, prompt in enumerate(prompts, 1):
+            main_autodraft(f"{name}_{idx}{ext}", args.config, prompt, args.minimal)
@@ -6,9 +6,11 @@ Script to fix image orientation by applying EXIF rotation and saving with orient
 import os
 import sys
 import argparse
-import glob
 from PIL import Image, ExifTags
 
+# Supported image extensions (matched against the lowercased filename)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tiff', '.bmp')
+
 def fix_image_orientation(input_path, output_suffix="_fixed", quality=95):
     """
     Fix image orientation by applying EXIF rotation and saving with orientation=1.
@@ -107,13 +109,16 @@ def process_folder(folder_path, output_suffix="_fixed", quality=95):
         print(f"Error: Folder not found at {folder_path}")
         return False
     
-    # Supported image extensions
-    image_extensions = ['*.jpg', '*.jpeg', '*.JPG', '*.JPEG', '*.png', '*.PNG', '*.tiff', '*.TIFF', '*.bmp', '*.BMP']
-    
-    # Find all image files in the folder
-    image_files = []
-    for ext in image_extensions:
-        image_files.extend(glob.glob(os.path.join(folder_path, ext)))
+    # Find all image files in the folder with a single directory read
+    # (scandir entries carry their file type, so no per-pattern glob or extra stat).
+    # Hidden files such as .DS_Store are rejected before any other check.
+    with os.scandir(folder_path) as entries:
+        image_files = [
+            entry.path for entry in entries
+            if not entry.name.startswith('.')
+            and entry.name.lower().endswith(IMAGE_EXTENSIONS)
+            and entry.is_file()
+        ]
     
     if not image_files:
         print(f"No image files found in {folder_path}")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for ConfigManager temp-config writes and the get_config cache."""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import ConfigManager, get_config, _load_config
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "autopost_config.test.json"
+    path.write_text(json.dumps({"gpt_model": "test-model", "gcs_bucket": "test-bucket"}))
+    return str(path)
+
+
+@pytest.fixture
+def save_calls(monkeypatch):
+    """Record every _save_temp_config() call while still writing the file."""
+    calls = []
+    original = ConfigManager._save_temp_config
+
+    def spy(self, values):
+        calls.append(dict(values))
+        return original(self, values)
+
+    monkeypatch.setattr(ConfigManager, "_save_temp_config", spy)
+    return calls
+
+
+def read_temp(config):
+    with open(config.temp_config_path) as f:
+        return json.load(f)
+
+
+def test_set_outside_batch_writes_immediately(config_path, save_calls):
+    config = ConfigManager(config_path)
+    config.set("gpt_previous_response_id", "resp_1")
+
+    assert save_calls == [{"gpt_previous_response_id": "resp_1"}]
+    assert read_temp(config) == {"gpt_previous_response_id": "resp_1"}
+
+
+def test_batch_defers_and_coalesces_writes(config_path, save_calls):
+    config = ConfigManager(config_path)
+    with config.batch():
+        config.set("gpt_previous_response_id", "resp_1")
+        config.set("gpt_previous_response_date", "2026-01-01")
+        config.set("gpt_previous_response_id", "resp_2")
+
+        # Values are visible in memory right away but nothing is on disk yet
+        assert config.get("gpt_previous_response_id") == "resp_2"
+        assert save_calls == []
+
+    assert save_calls == [{"gpt_previous_response_id": "resp_2", "gpt_previous_response_date": "2026-01-01"}]
+    assert read_temp(config) == {"gpt_previous_response_id": "resp_2", "gpt_previous_response_date": "2026-01-01"}
+
+
+def test_nested_batch_flushes_once_at_outermost_exit(config_path, save_calls):
+    config = ConfigManager(config_path)
+    with config.batch():
+        config.set("a", 1)
+        with config.batch():
+            config.set("b", 2)
+        assert save_calls == []
+        config.set("c", 3)
+
+    assert save_calls == [{"a": 1, "b": 2, "c": 3}]
+
+
+def test_batch_flushes_pending_values_on_error(config_path, save_calls):
+    config = ConfigManager(config_path)
+    with pytest.raises(RuntimeError):
+        with config.batch():
+            config.set("a", 1)
+            raise RuntimeError("boom")
+
+    assert save_calls == [{"a": 1}]
+    assert config._batch_depth == 0
+
+
+def test_unchanged_values_skip_the_file_write(config_path):
+    config = ConfigManager(config_path)
+    config.set("a", 1)
+    mtime = Path(config.temp_config_path).stat().st_mtime_ns
+
+    config.set("a", 1)
+
+    assert Path(config.temp_config_path).stat().st_mtime_ns == mtime
+
+
+@pytest.fixture
+def fresh_config_cache():
+    _load_config.cache_clear()
+    yield
+    _load_config.cache_clear()
+
+
+def bump_mtime(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + seconds))
+
+
+def test_get_config_returns_cached_instance(config_path, fresh_config_cache):
+    assert get_config(config_path) is get_config(config_path)
+
+
+def test_get_config_reloads_after_file_edit(config_path, fresh_config_cache):
+    config = get_config(config_path)
+
+    with open(config_path, "w") as f:
+        json.dump({"gpt_model": "edited-model"}, f)
+    bump_mtime(config_path)
+
+    reloaded = get_config(config_path)
+    assert reloaded is not config
+    assert reloaded.get("gpt_model") == "edited-model"
+
+
+def test_get_config_reloads_after_temp_file_edit(config_path, fresh_config_cache):
+    config = get_config(config_path)
+    config.set("gpt_model", "temp-model")
+    config = get_config(config_path)
+
+    with open(config.temp_config_path, "w") as f:
+        json.dump({"gpt_model": "hand-edited"}, f)
+    bump_mtime(config.temp_config_path)
+
+    assert get_config(config_path).get("gpt_model") == "hand-edited"
+
+
+def test_set_clears_get_config_cache(config_path, fresh_config_cache):
+    config = get_config(config_path)
+    config.set("gpt_model", "new-model")
+
+    reloaded = get_config(config_path)
+    assert reloaded is not config
+    assert reloaded.get("gpt_model") == "new-model"
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Tests for GCSManager folder uploads (no real bucket is touched)."""
+
+import os
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from autopotter_tools import gcs_manager
+from autopotter_tools.gcs_manager import GCSManager
+
+
+class FakeUploads:
+    """Stands in for GCSManager.upload_file and tracks how far submission runs ahead."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.lock = threading.Lock()
+        self.pulled = 0
+        self.completed = 0
+        self.max_outstanding = 0
+        self.uploaded = []
+
+    def source(self, count):
+        for i in range(count):
+            with self.lock:
+                self.pulled += 1
+                self.max_outstanding = max(self.max_outstanding, self.pulled - self.completed)
+            yield f"/local/file_{i}.mp4", f"video_uploads/file_{i}.mp4"
+
+    def upload_file(self, local_path, blob_name):
+        time.sleep(0.005)
+        with self.lock:
+            self.completed += 1
+            self.uploaded.append(blob_name)
+        return blob_name not in self.failing
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    def upload_from_filename(self, filename, retry=None):
+        if self.name in self.bucket.failing:
+            raise IOError(f"upload of {self.name} failed")
+        with self.bucket.lock:
+            self.bucket.uploaded[self.name] = filename
+
+
+class FakeBucket:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.lock = threading.Lock()
+        self.uploaded = {}
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+
+@pytest.fixture
+def manager():
+    # Skip __init__ so no config file or storage client is needed
+    manager = GCSManager.__new__(GCSManager)
+    manager.upload_workers = 2
+    manager.bucket = FakeBucket()
+    manager.bucket_name = "test-bucket"
+    manager.multipart_threshold = 1 << 30
+    manager._scan_cache = {}
+    manager._scan_cache_lock = threading.Lock()
+    return manager
+
+
+def test_upload_many_uploads_everything(manager):
+    fake = FakeUploads()
+    manager.upload_file = fake.upload_file
+
+    assert manager._upload_many(fake.source(25)) is True
+    assert sorted(fake.uploaded) == sorted(f"video_uploads/file_{i}.mp4" for i in range(25))
+
+
+def test_upload_many_bounds_pending_uploads(manager):
+    fake = FakeUploads()
+    manager.upload_file = fake.upload_file
+
+    manager._upload_many(fake.source(40))
+
+    # At most 2x workers uploads are pending when the next item is pulled
+    assert fake.max_outstanding <= manager.upload_workers * 2 + 1
+
+
+def test_upload_many_counts_failures_and_finishes_the_rest(manager, monkeypatch):
+    errors = []
+    monkeypatch.setattr(gcs_manager.Logger, "error", staticmethod(errors.append))
+    fake = FakeUploads(failing={"video_uploads/file_3.mp4", "video_uploads/file_17.mp4"})
+    manager.upload_file = fake.upload_file
+
+    assert manager._upload_many(fake.source(20)) is False
+    assert len(fake.uploaded) == 20
+    assert errors == ["2 of 20 uploads failed"]
+
+
+def test_upload_many_with_nothing_to_upload(manager):
+    fake = FakeUploads()
+    manager.upload_file = fake.upload_file
+
+    assert manager._upload_many(iter(())) is True
+
+
+def test_upload_many_through_upload_file_with_bucket(manager, tmp_path, monkeypatch):
+    monkeypatch.setattr(gcs_manager.Logger, "error", staticmethod(lambda msg: None))
+    manager.bucket = FakeBucket(failing={"video_uploads/clip_1.mp4"})
+    files = []
+    for i in range(4):
+        path = tmp_path / f"clip_{i}.mp4"
+        path.write_bytes(b"x")
+        files.append((str(path), f"video_uploads/clip_{i}.mp4"))
+
+    assert manager._upload_many(iter(files)) is False
+    assert sorted(manager.bucket.uploaded) == ["video_uploads/clip_0.mp4", "video_uploads/clip_2.mp4", "video_uploads/clip_3.mp4"]
+
+
+def test_iter_folder_uploads_skips_only_matching_content(manager, tmp_path, monkeypatch):
+    (tmp_path / "same.mp4").write_bytes(b"abc")
+    (tmp_path / "edited.mp4").write_bytes(b"xyz")
+    (tmp_path / "composite.mp4").write_bytes(b"abc")
+    (tmp_path / "resized.mp4").write_bytes(b"abcd")
+    (tmp_path / "new.mp4").write_bytes(b"abc")
+    md5_abc = GCSManager._local_md5(str(tmp_path / "same.mp4"))
+    existing_blobs = {
+        "video_uploads/same.mp4": (3, md5_abc),
+        "video_uploads/edited.mp4": (3, md5_abc),
+        "video_uploads/composite.mp4": (3, None),
+        "video_uploads/resized.mp4": (3, md5_abc),
+    }
+    hashed = []
+    original_md5 = GCSManager._local_md5
+    monkeypatch.setattr(GCSManager, "_local_md5", staticmethod(lambda path: hashed.append(os.path.basename(path)) or original_md5(path)))
+
+    uploads = dict(manager._iter_folder_uploads(str(tmp_path), "video_uploads", existing_blobs=existing_blobs))
+
+    assert sorted(uploads.values()) == ["video_uploads/composite.mp4", "video_uploads/edited.mp4",
+                                        "video_uploads/new.mp4", "video_uploads/resized.mp4"]
+    # Only same-size candidates with a remote MD5 are hashed
+    assert sorted(hashed) == ["edited.mp4", "same.mp4"]
+
+
+def test_list_field_masks_include_size_for_folder_marker_check():
+    # _is_folder_marker() reads blob.size first; without it in the mask every blob falls through
+    assert "size" in gcs_manager._SCAN_FIELDS
+    assert "size" in gcs_manager._LATEST_FIELDS
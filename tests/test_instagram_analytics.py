@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Tests for InstagramAnalyticsManager's Graph API batch requests (HTTP session is faked)."""
+
+import sys
+import json
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qsl
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from autopotter_tools.instagram_analytics import InstagramAnalyticsManager
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self.payload
+
+
+class FakeGraphSession:
+    """Answers batch POSTs with one entry per sub-request, built by respond(relative_url)."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.posts = []
+
+    def post(self, url, data=None, timeout=None):
+        assert timeout, "Graph calls must not block without a timeout"
+        batch = json.loads(data["batch"])
+        self.posts.append((url, data["access_token"], batch))
+        return FakeResponse([self.respond(request["relative_url"]) for request in batch])
+
+
+def insight_entry(relative_url, value=7):
+    query = dict(parse_qsl(urlsplit(relative_url).query))
+    body = {"data": [{"name": query["metric"], "total_value": {"value": value}}]}
+    return {"code": 200, "body": json.dumps(body)}
+
+
+@pytest.fixture
+def manager():
+    # Skip __init__ so no config file or token check is needed
+    manager = InstagramAnalyticsManager.__new__(InstagramAnalyticsManager)
+    manager.base_url = "https://graph.facebook.com/v22.0"
+    manager.instagram_account_id = "1784"
+    manager.page_access_token = "page-token"
+    return manager
+
+
+def test_batch_get_chunks_at_fifty_and_keeps_order(manager):
+    manager.http = FakeGraphSession(lambda relative_url: {"code": 200, "body": relative_url})
+    relative_urls = [f"1784/media?page={i}" for i in range(120)]
+
+    entries = manager._batch_get(relative_urls)
+
+    assert [len(batch) for _, _, batch in manager.http.posts] == [50, 50, 20]
+    assert all(url == manager.base_url and token == "page-token" for url, token, _ in manager.http.posts)
+    assert all(request["method"] == "GET" for _, _, batch in manager.http.posts for request in batch)
+    assert [entry["body"] for entry in entries] == relative_urls
+
+
+def test_batch_get_passes_through_null_entries(manager):
+    manager.http = FakeGraphSession(lambda relative_url: None if relative_url.endswith("=1") else {"code": 200, "body": "{}"})
+
+    entries = manager._batch_get(["a?x=0", "a?x=1", "a?x=2"])
+
+    assert entries == [{"code": 200, "body": "{}"}, None, {"code": 200, "body": "{}"}]
+
+
+def test_account_insights_use_one_batch_call(manager):
+    manager.http = FakeGraphSession(insight_entry)
+
+    insights = manager.get_account_insights()
+
+    assert len(manager.http.posts) == 1
+    assert insights["follower_count"] == {"day": 7}
+    assert insights["reach"] == {"day": 7, "week": 7, "days_28": 7}
+
+
+def test_account_insights_skip_null_and_failed_entries(manager):
+    def respond(relative_url):
+        if "metric=reach" in relative_url and "period=week" in relative_url:
+            return None
+        if "metric=likes" in relative_url:
+            return {"code": 400, "body": json.dumps({"error": {"message": "unsupported"}})}
+        return insight_entry(relative_url)
+
+    manager.http = FakeGraphSession(respond)
+
+    insights = manager.get_account_insights()
+
+    assert insights["reach"] == {"day": 7, "days_28": 7}
+    assert "likes" not in insights
+    assert insights["comments"] == {"day": 7, "week": 7, "days_28": 7}
+
+
+def test_account_insights_return_empty_when_batch_call_fails(manager):
+    class FailingSession:
+        def post(self, url, data=None, timeout=None):
+            return FakeResponse({"error": "down"}, status_code=500)
+
+    manager.http = FailingSession()
+
+    assert manager.get_account_insights() == {}
+
+
+def test_insights_configurations_report_each_sub_response(manager):
+    def respond(relative_url):
+        if "metric=reach" in relative_url:
+            return None
+        if "metric=likes" in relative_url:
+            return {"code": 400, "body": "x" * 300}
+        return {"code": 200, "body": "{}"}
+
+    manager.http = FakeGraphSession(respond)
+
+    results = manager.test_insights_configurations()
+
+    assert len(manager.http.posts) == 1
+    assert len(results) == 27
+    assert results["follower_count_day"]["success"] is True
+    assert results["reach_week"] == {"status_code": None, "success": False, "response": "", "config": {"metric": "reach", "period": "week"}}
+    assert results["likes_day"]["response"] == "x" * 200
+    assert results["profile_views_day"]["config"]["metric_type"] == "total_value"
+
+
+def test_available_fields_use_one_batch_call(manager):
+    def respond(relative_url):
+        query = dict(parse_qsl(urlsplit(relative_url).query))
+        return {"code": 200, "body": json.dumps({field: "x" for field in query["fields"].split(",")})}
+
+    manager.http = FakeGraphSession(respond)
+
+    results = manager.test_available_fields()
+
+    assert len(manager.http.posts) == 1
+    assert manager.http.posts[0][2][0]["relative_url"].startswith("1784?fields=")
+    (result,) = results.values()
+    assert result["status"] == "success"
+    assert "followers_count" in result["fields_returned"]
+
+
+def test_available_fields_report_failed_and_null_entries(manager):
+    manager.http = FakeGraphSession(lambda relative_url: None)
+
+    (result,) = manager.test_available_fields().values()
+
+    assert result == {"status": "error", "status_code": None, "error": ""}